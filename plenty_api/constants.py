@@ -70,7 +70,7 @@ REDISTRIBUTION_DATE_TYPES = {
 
 # Refine argument keys for GET requests to filter the data
 VALID_REFINE_KEYS = {
-    'order': [
+    'order': frozenset([
         'orderType', 'contactId', 'referrerId', 'shippingProfileId',
         'shippingServiceProviderId', 'ownerUserId', 'warehouseId',
         'isEbayPlus', 'includedVariation', 'includedItem', 'orderIds',
@@ -78,37 +78,37 @@ VALID_REFINE_KEYS = {
         'sender.warehouse', 'receiver.contact', 'receiver.warehouse',
         'externalOrderId', 'clientId', 'paymentStatus', 'statusFrom',
         'statusTo', 'hasDocument', 'hasDocumentNumber', 'parentOrderId'
-    ],
-    'item': [
+    ]),
+    'item': frozenset([
         'name', 'manufacturerId', 'id', 'flagOne', 'flagTwo'
-    ],
-    'variation': [
+    ]),
+    'variation': frozenset([
         'id', 'itemId', 'flagOne', 'flagTwo', 'categoryId', 'isMain',
         'isActive', 'barcode', 'referrerId', 'sku', 'date'
-    ],
-    'manufacturer': [
+    ]),
+    'manufacturer': frozenset([
         'name'
-    ],
-    'stockmanagement': [
+    ]),
+    'stockmanagement': frozenset([
         'variationId',
-    ],
-    'warehouses': [
+    ]),
+    'warehouses': frozenset([
         'variationId', 'storageLocationId'
-    ],
-    'contact': [
+    ]),
+    'contact': frozenset([
         'fullText', 'contactEmail', 'email', 'postalCode', 'plentyId',
         'externalId', 'number', 'typeId', 'rating', 'newsletterAllowanceAfter',
         'newsletterAllowanceBefore', 'newsletterAllowance', 'contactId',
         'contactAddress', 'countryId', 'userId', 'referrerId', 'name',
         'nameOrId', 'town', 'privatePhone', 'billingAddressId',
         'deliveryAddressId', 'tagIds'
-    ]
+    ])
 }
 
 # Valid additional argument values for GET requests, which are used to
 # add optional data to the response body
 VALID_ADDITIONAL_VALUES = {
-    'order': [
+    'order': frozenset([
         'addresses', 'relations', 'comments', 'location', 'payments',
         'documents', 'contactSender', 'contactReceiver',
         'warehouseSender', 'warehouseReceiver', 'orderItems.variation',
@@ -116,12 +116,12 @@ VALID_ADDITIONAL_VALUES = {
         'orderItems.serialNumbers', 'orderItems.variationBarcodes',
         'orderItems.comments', 'originOrderReferences',
         'shippingPackages'
-    ],
-    'item': [
+    ]),
+    'item': frozenset([
         'itemProperties', 'itemCrossSelling', 'variations', 'itemImages',
         'itemShippingProfiles', 'ebayTitles'
-    ],
-    'variation': [
+    ]),
+    'variation': frozenset([
         'properties', 'variationProperties', 'variationBarcodes',
         'variationBundleComponents', 'variationComponentBundles',
         'variationSalesPrices', 'marketItemNumbers', 'variationCategories',
@@ -129,20 +129,20 @@ VALID_ADDITIONAL_VALUES = {
         'variationSuppliers', 'variationWarehouses', 'images', 'itemImages',
         'variationAttributeValues', 'variationSkus', 'variationAdditionalSkus',
         'unit', 'parent', 'item', 'stock'
-    ],
-    'manufacturer': [
+    ]),
+    'manufacturer': frozenset([
         'commisions', 'externals'
-    ],
-    'attribute': [
+    ]),
+    'attribute': frozenset([
         'names', 'values', 'maps'
-    ],
-    'contact': [
+    ]),
+    'contact': frozenset([
         'addresses', 'accounts', 'options', 'orderSummary',
         'primaryBillingAddress', 'contactOrders'
-    ],
-    'warehouses': [
+    ]),
+    'warehouses': frozenset([
         'storageLocation'
-    ]
+    ])
 }
 
 VALID_LANGUAGES = [
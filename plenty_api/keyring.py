@@ -2,22 +2,27 @@ import getpass
 import keyring
 
 
+def set_credentials():
+    username = input('Username: ')
+    keyring.set_password('plenty-identity', 'user', username)
+    keyring.set_password('plenty-identity', 'password', getpass.getpass())
+
+
+def get_credentials():
+    user = keyring.get_password('plenty-identity', 'user')
+    password = keyring.get_password('plenty-identity', 'password')
+    if not user or not password:
+        return {}
+    return {'username': user, 'password': password}
+
+
+def delete_credentials():
+    keyring.delete_password('plenty-identity', 'user')
+    keyring.delete_password('plenty-identity', 'password')
+
+
 class CredentialManager():
-    def __init__(self):
-        pass
-
-    def set_credentials(self):
-        username = input('Username: ')
-        keyring.set_password('plenty-identity', 'user', username)
-        keyring.set_password('plenty-identity', 'password', getpass.getpass())
-
-    def get_credentials(self):
-        user = keyring.get_password('plenty-identity', 'user')
-        password = keyring.get_password('plenty-identity', 'password')
-        if not user or not password:
-            return {}
-        return {'username': user, 'password': password}
-
-    def delete_credentials(self):
-        keyring.delete_password('plenty-identity', 'user')
-        keyring.delete_password('plenty-identity', 'password')
+    """ Backwards compatible wrapper around the module level functions """
+    set_credentials = staticmethod(set_credentials)
+    get_credentials = staticmethod(get_credentials)
+    delete_credentials = staticmethod(delete_credentials)
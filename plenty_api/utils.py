@@ -21,13 +21,31 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 import getpass
 import datetime
-import time
+import functools
 import re
+import time
+import urllib.parse
 import dateutil.parser
-import pandas
 import logging
 
 import plenty_api.constants as constants
+import plenty_api.keyring
+
+_VALID_DOMAIN_SET = frozenset(constants.VALID_DOMAINS)
+_VALID_ROUTE_SET = frozenset(constants.VALID_ROUTES)
+# Accept the common lower- and upper-case spellings without a conversion
+_LANGUAGE_MAP = {
+    **{lang: lang for lang in constants.VALID_LANGUAGES},
+    **{lang.upper(): lang for lang in constants.VALID_LANGUAGES}
+}
+_LEADING_NUMBER_RE = re.compile(r'\d{2,}(?=\D)')
+# Optional batch handling keys that are copied into a transaction
+_TRANSACTION_EXTRA_KEYS = ('batch', 'bestBeforeDate', 'identification')
+# Query parameter names for the start and end of each order date type
+_DATE_QUERY_KEYS = {
+    date_type: (f"{prefix}AtFrom", f"{prefix}AtTo")
+    for date_type, prefix in constants.ORDER_DATE_ARGUMENTS.items()
+}
 
 
 def create_vat_mapping(data: list, subset: list = None) -> dict:
@@ -44,16 +62,20 @@ def create_vat_mapping(data: list, subset: list = None) -> dict:
     mapping = {}
     if not data or not isinstance(data[0], dict):
         return {}
+    countries = None
+    if subset:
+        # Normalize the subset once instead of converting every country ID
+        countries = frozenset(str(country) for country in subset)
     for entry in data:
         country = str(entry['countryId'])
-        if country not in mapping.keys():
+        if countries is not None and country not in countries:
+            continue
+        country_map = mapping.get(country)
+        if country_map is None:
             mapping[country] = {'config': [str(entry['id'])],
                                 'TaxId': entry['taxIdNumber']}
         else:
-            mapping[country]['config'].append(str(entry['id']))
-
-    if subset:
-        return {x: y for x, y in mapping.items() if int(x) in subset}
+            country_map['config'].append(str(entry['id']))
 
     return mapping
 
@@ -83,28 +105,22 @@ def attribute_variation_mapping(variation: dict, attribute: dict) -> dict:
         return attribute
 
     for var in variation:
-        if 'variationAttributeValues' not in var.keys():
+        if 'variationAttributeValues' not in var:
             logging.warning("variations without attribute values"
                             " used for attribute mapping")
             return attribute
         for attr in var['variationAttributeValues']:
-            attr_id = str(attr['attributeId'])
-            val_id = str(attr['valueId'])
-            if attr_id not in value_id_map:
-                value_id_map[attr_id] = {val_id: [var['id']]}
-                continue
-            if val_id not in value_id_map[attr_id]:
-                value_id_map[attr_id][val_id] = [var['id']]
-                continue
-            value_id_map[attr_id][val_id].append(var['id'])
+            value_id_map.setdefault(attr['attributeId'], {}).setdefault(
+                attr['valueId'], []).append(var['id'])
 
     for entry in attribute:
-        attr_id = str(entry['id'])
-        if attr_id in value_id_map:
-            for value in entry['values']:
-                val_id = str(value['id'])
-                if val_id in value_id_map[attr_id]:
-                    value['linked_variations'] = value_id_map[attr_id][val_id]
+        value_map = value_id_map.get(entry['id'])
+        if value_map is None:
+            continue
+        for value in entry['values']:
+            linked = value_map.get(value['id'])
+            if linked is not None:
+                value['linked_variations'] = linked
 
     return attribute
 
@@ -120,44 +136,28 @@ def shrink_price_configuration(data: dict) -> dict:
     Return:
                         [dict]
     """
-    configuration: dict = {
-        'id': 0,
-        'type': '',
-        'position': 0,
-        'names': {},
-        'referrers': [],
-        'accounts': [],
-        'clients': [],
-        'countries': [],
-        'currencies': [],
-        'customerClasses': []
-    }
-
     if not data:
         return {}
 
-    key_subkey_map = {
-        'clients': 'plentyId',
-        'countries': 'countryId',
-        'currencies': 'currency',
-        'customerClasses': 'customerClassId',
-        'referrers': 'referrerId',
-        'names': 'nameExternal'
+    return {
+        'id': data['id'],
+        'type': data['type'],
+        'position': data['position'],
+        'names': {name['lang']: name['nameExternal']
+                  for name in data.get('names', [])},
+        'referrers': [referrer['referrerId']
+                      for referrer in data.get('referrers', [])],
+        'accounts': [],
+        'clients': [client['plentyId'] for client in data.get('clients', [])],
+        'countries': [country['countryId']
+                      for country in data.get('countries', [])],
+        'currencies': [currency['currency']
+                       for currency in data.get('currencies', [])],
+        'customerClasses': [customer_class['customerClassId']
+                            for customer_class in
+                            data.get('customerClasses', [])]
     }
 
-    for key in ['id', 'type', 'position']:
-        configuration[key] = data[key]
-
-    for key in key_subkey_map:
-        for entity in data[key]:
-            subkey = key_subkey_map[key]
-            if key == 'names':
-                configuration[key].update({entity['lang']: entity[subkey]})
-                continue
-            configuration[key].append(entity[subkey])
-
-    return configuration
-
 
 def get_route(domain: str) -> str:
     """
@@ -170,9 +170,14 @@ def get_route(domain: str) -> str:
     Return:
                         [str]
     """
-    for valid_domain in constants.VALID_DOMAINS:
-        if re.match(valid_domain, domain.lower()):
-            return constants.DOMAIN_ROUTE_MAP[valid_domain]
+    domain = domain.lower()
+    route = constants.DOMAIN_ROUTE_MAP.get(domain)
+    if route is not None:
+        return route
+    # Fall back to prefix matching for variations like 'items' or 'orders'
+    for valid_domain, route in constants.DOMAIN_ROUTE_MAP.items():
+        if domain.startswith(valid_domain):
+            return route
     return ''
 
 
@@ -187,10 +192,10 @@ def get_language(lang: str) -> str:
     Return:
                         [str]       -   Language abbreviation in lower-case
     """
-    lang = lang.lower()
-    if lang not in constants.VALID_LANGUAGES:
-        return 'INVALID_LANGUAGE'
-    return lang
+    language = _LANGUAGE_MAP.get(lang)
+    if language is None:
+        language = _LANGUAGE_MAP.get(lang.lower(), 'INVALID_LANGUAGE')
+    return language
 
 
 def sanity_check_parameter(domain: str,
@@ -217,13 +222,13 @@ def sanity_check_parameter(domain: str,
     if not query:
         query = {}
 
-    if domain not in constants.VALID_DOMAINS:
+    if domain not in _VALID_DOMAIN_SET:
         logging.error(f"Invalid domain name {domain}")
         return {}
 
     if refine:
-        invalid_keys = set(refine.keys()).difference(
-            constants.VALID_REFINE_KEYS[domain])
+        valid_keys = constants.VALID_REFINE_KEYS[domain]
+        invalid_keys = [key for key in refine if key not in valid_keys]
         if invalid_keys:
             logging.info(f"Invalid refine argument key removed: {invalid_keys}")
             for invalid_key in invalid_keys:
@@ -232,13 +237,14 @@ def sanity_check_parameter(domain: str,
             query.update(refine)
 
     if additional:
-        invalid_values = set(additional).difference(
-            constants.VALID_ADDITIONAL_VALUES[domain])
+        valid_values = constants.VALID_ADDITIONAL_VALUES[domain]
+        invalid_values = [value for value in additional
+                          if value not in valid_values]
         if invalid_values:
             logging.info("Invalid additional argument removed: "
                          f"{invalid_values}")
-            for invalid_value in invalid_values:
-                additional.remove(invalid_value)
+            additional[:] = [value for value in additional
+                             if value in valid_values]
         if additional:
             if domain == 'order':
                 query.update({'with[]': additional})
@@ -263,17 +269,18 @@ def sanity_check_json(route_name: str, json: dict) -> bool:
     Return:
                         [bool]
     """
-    if route_name not in constants.REQUIRED_FIELDS_MAP.keys():
+    required_fields = constants.REQUIRED_FIELDS_MAP.get(route_name)
+    if required_fields is None:
         logging.error(f"unknown route {route_name} in required fields map.")
         return False
 
-    required_keys = [x[0] for x in constants.REQUIRED_FIELDS_MAP[route_name]]
+    required_keys = [x[0] for x in required_fields]
     if not list_contains(search_list=required_keys, target_list=json.keys()):
         logging.error(f"{required_keys} fields required for {route_name} "
                       f"creation. Got: {list(json.keys())}")
         return False
 
-    for key, field_type in constants.REQUIRED_FIELDS_MAP[route_name]:
+    for key, field_type in required_fields:
         if not json_field_filled(json_field=json[key], field_type=field_type):
             logging.error(f"Empty required field within JSON ({key}).")
             return False
@@ -294,10 +301,10 @@ def validate_redistribution_template(template: dict) -> bool:
                                     redistribution creation
     """
     for variation in template['variations']:
-        if 'locations' in variation.keys():
+        if 'locations' in variation:
             try:
                 individual_quantities = sum(
-                    [int(x['quantity']) for x in variation['locations']])
+                    int(x['quantity']) for x in variation['locations'])
             except ValueError as err:
                 logging.error(f"invalid quantity value ({err})")
                 return False
@@ -309,9 +316,9 @@ def validate_redistribution_template(template: dict) -> bool:
                 return False
 
             for location in variation['locations']:
-                if 'targets' in location.keys():
+                if 'targets' in location:
                     target_quantities = sum(
-                        [int(x['quantity']) for x in location['targets']])
+                        int(x['quantity']) for x in location['targets'])
                     if location['quantity'] != target_quantities:
                         logging.error("Quantity of location "
                                       f"{location['location_id']} doesn't "
@@ -344,18 +351,16 @@ def build_query_date(date_range: dict, date_type: str) -> dict:
     Return:
                         [dict]  -   Date range in python dictionary
     """
-    query = {}
     if not date_range or not date_type:
         logging.error("Both date type and date range required")
-        return ''
-    if date_type.lower() not in constants.ORDER_DATE_ARGUMENTS.keys():
+        return {}
+    query_keys = _DATE_QUERY_KEYS.get(date_type.lower())
+    if query_keys is None:
         logging.error(f"Invalid date type for query creation: {date_type}")
-        return ''
-    date_type = constants.ORDER_DATE_ARGUMENTS[date_type.lower()]
-    query.update({f"{date_type}AtFrom": date_range['start']})
-    query.update({f"{date_type}AtTo": date_range['end']})
+        return {}
 
-    return query
+    return {query_keys[0]: date_range['start'],
+            query_keys[1]: date_range['end']}
 
 
 def build_endpoint(url: str, route: str, path: str = '') -> str:
@@ -373,15 +378,16 @@ def build_endpoint(url: str, route: str, path: str = '') -> str:
     Parameter:
                         [str]       -   complete endpoint
     """
-    if not re.search(r'https://.*', url):
+    parsed_url = urllib.parse.urlparse(url)
+    if parsed_url.scheme != 'https' or not parsed_url.netloc:
         logging.error(f"Provided url parameter [{url}] is no valid https url.")
         return ''
 
-    if route not in constants.VALID_ROUTES:
+    if route not in _VALID_ROUTE_SET:
         logging.error(f"Invalid route, [{route}]")
         return ''
 
-    return url + route + path
+    return f"{url}{route}{path}"
 
 
 def build_date_update_json(date_type: str, date: datetime.datetime) -> dict:
@@ -397,26 +403,45 @@ def build_date_update_json(date_type: str, date: datetime.datetime) -> dict:
     Return:
                         [dict]      -   valid JSON for the request
     """
-    if date_type not in constants.REDISTRIBUTION_DATE_TYPES.keys():
+    if date_type not in constants.REDISTRIBUTION_DATE_TYPES:
         logging.error(f"Invalid date type {date_type} for a redistribution")
         return {}
 
-    date_str = parse_date(date=date.strftime("%Y-%m-%dT%H:%M:%S"))
-    if not date_str:
-        logging.error(f"Invalid date {str(date)}.")
-        return {}
+    date_str, offset = _split_w3c(date)
 
     json = {
         'dates': [
             {
                 'typeId': constants.REDISTRIBUTION_DATE_TYPES[date_type],
-                'date': date_str
+                'date': date_str + (offset or get_utc_offset())
             }
         ]
     }
     return json
 
 
+def _build_redistribution_item(variation: dict) -> dict:
+    """
+    Create the order item JSON for a single variation of a redistribution
+    template.
+    """
+    item = {
+        'typeId': 1,
+        'itemVariationId': variation['variation_id'],
+        'quantity': variation['total_quantity'],
+        'orderItemName': variation['name'],
+        'amounts': [
+            {
+                'isSystemCurrency': True,
+                'priceOriginalGross': variation.get('amounts', 0)
+            }
+        ]
+    }
+    if 'referrer' in variation:
+        item['referrerId'] = variation['referrer']
+    return item
+
+
 def build_redistribution_json(template: dict) -> dict:
     """
     Create a valid JSON for a redistribution POST request.
@@ -431,34 +456,10 @@ def build_redistribution_json(template: dict) -> dict:
                             [dict]  -   valid JSON for the request
     """
     variations = [
-        {
-            'typeId': 1,
-            'itemVariationId': x['variation_id'],
-            'quantity': x['total_quantity'],
-            'orderItemName': x['name']
-        }
-        for x in template['variations']
+        _build_redistribution_item(variation=variation)
+        for variation in template['variations']
     ]
 
-    for index, variation in enumerate(template['variations']):
-        if 'amounts' in variation.keys():
-            variations[index]['amounts'] = [
-                {
-                    'isSystemCurrency': True,
-                    'priceOriginalGross': variation['amounts']
-                }
-            ]
-        else:
-            variations[index]['amounts'] = [
-                {
-                    'isSystemCurrency': True,
-                    'priceOriginalGross': 0
-                }
-            ]
-
-        if 'referrer' in variation.keys():
-            variation[index]['referrerId'] = variation['referrer']
-
     json = {
         'typeId': 15,
         'plentyId': template['plenty_id'],
@@ -512,8 +513,8 @@ def build_transaction(order_item_id: int, location: dict,
     if user_id > 0:
         json['userId'] = user_id
 
-    for extra_key in ['batch', 'bestBeforeDate', 'identification']:
-        if extra_key in kwargs.keys():
+    for extra_key in _TRANSACTION_EXTRA_KEYS:
+        if extra_key in kwargs:
             json[extra_key] = kwargs[extra_key]
 
     return json
@@ -537,66 +538,161 @@ def build_transactions(order: dict, variations: dict,
     """
     outgoing = []
     incoming = []
+    variation_by_id = {
+        variation['variation_id']: variation for variation in variations
+    }
     for item in order['orderItems']:
-        template_variation = [
-            x for x in variations
-            if x['variation_id'] == item['itemVariationId']
-        ][0]
-        if 'locations' not in template_variation.keys():
+        template_variation = variation_by_id.get(item['itemVariationId'])
+        if template_variation is None or \
+                'locations' not in template_variation:
             continue
         kwargs = {}
-        for extra_key in ['batch', 'bestBeforeDate', 'identification']:
-            if not extra_key in template_variation.keys():
-                continue
-            kwargs[extra_key] = template_variation[extra_key]
-
-        for location in template_variation['locations']:
-            outgoing.append(
-                build_transaction(order_item_id=item['id'], location=location,
-                                  direction='out', user_id=user_id,
-                                  **kwargs)
-            )
-            if 'targets' in location.keys():
-                for target in location['targets']:
-                    incoming.append(
-                        build_transaction(
-                            order_item_id=item['id'], location=target,
-                            direction='in', user_id=user_id, **kwargs)
-                    )
+        for extra_key in _TRANSACTION_EXTRA_KEYS:
+            if extra_key in template_variation:
+                kwargs[extra_key] = template_variation[extra_key]
+
+        locations = template_variation['locations']
+        outgoing += [
+            build_transaction(order_item_id=item['id'], location=location,
+                              direction='out', user_id=user_id, **kwargs)
+            for location in locations
+        ]
+        incoming += [
+            build_transaction(order_item_id=item['id'], location=target,
+                              direction='in', user_id=user_id, **kwargs)
+            for location in locations if 'targets' in location
+            for target in location['targets']
+        ]
     return (outgoing, incoming)
 
 
 
-def json_to_dataframe(json):
-    """ simple wrapper for the data conversion from JSON dict to dataframe """
-    return pandas.json_normalize(json)
+def json_to_dataframe(json, flat: bool = None, columns: list = None):
+    """
+    simple wrapper for the data conversion from JSON dict to dataframe
+
+    Lists of flat records are handed to the DataFrame constructor directly,
+    which is a lot faster than `json_normalize` and produces the same result
+    when there are no nested objects to flatten.
+
+    Parameter:
+        json            [list/dict] -   JSON response data
+        flat            [bool]      -   True: the records contain no nested
+                                        objects, False: always normalize,
+                                        None: detect the shape
+        columns         [list]      -   OPTIONAL: select and order the
+                                        columns of the dataframe
+
+    Return:
+                        [DataFrame]
+    """
+    # pandas is only required for the dataframe output format and takes a
+    # considerable time to import, so defer the import until it is used
+    import pandas
+    if flat is None:
+        flat = isinstance(json, list) and all(
+            isinstance(record, dict) and
+            not any(isinstance(value, dict) for value in record.values())
+            for record in json)
+    if flat:
+        return pandas.DataFrame(json, columns=columns)
+    frame = pandas.json_normalize(json)
+    if columns is not None:
+        frame = frame.reindex(columns=columns)
+    return frame
+
+
+_DATA_FORMAT_TRANSFORMERS = {
+    'json': lambda data: data,
+    'dataframe': json_to_dataframe
+}
 
 
 def transform_data_type(data: dict, data_format: str):
-    """ simple wrapper around the data conversion before return """
-    if not data:
+    """
+    simple wrapper around the data conversion before return, empty responses
+    are returned unchanged and unknown formats fall back to JSON
+    """
+    if data is None:
         return {}
-
-    if data_format == 'json':
+    if not data:
         return data
 
-    if data_format == 'dataframe':
-        data = json_to_dataframe(json=data)
-        return data
+    return _DATA_FORMAT_TRANSFORMERS.get(
+        data_format, _DATA_FORMAT_TRANSFORMERS['json'])(data)
+
+
+@functools.lru_cache(maxsize=2)
+def _utc_offset_for_hour(hour: int) -> str:
+    """
+    Compute the local UTC offset, @hour (hours since the epoch) only serves
+    as the cache key, so that the offset is computed at most once per hour.
+    """
+    current = datetime.datetime.now(datetime.timezone.utc).astimezone()
+    offset = int(current.tzinfo.utcoffset(None).total_seconds())
+    sign = '-' if offset < 0 else '+'
+    hours, minutes = divmod(abs(offset) // 60, 60)
+    return f"{sign}{hours:02d}:{minutes:02d}"
 
 
 def get_utc_offset() -> str:
     """
     Determine the time difference between the current timezone of the user
-    and UTC and return a string with the format "02:00"
+    and UTC and return a string with the format "+02:00", "-05:00" or "+05:30"
+
+    The offset is computed at most once per hour, which is enough to pick up
+    a DST change in long running processes.
 
     Return:
                         [str]
     """
-    current = datetime.datetime.now(datetime.timezone.utc).astimezone()
-    offset = current.tzinfo.utcoffset(None)
-    offset_hours = offset.seconds // 3600
-    return str("{:0>2d}:00".format(offset_hours))
+    return _utc_offset_for_hour(int(time.time()) // 3600)
+
+
+def _parse_iso_date(date: str):
+    """
+    Fast path for ISO 8601 dates, return None for any other format.
+
+    ISO 8601 is by far the most common input and the C implementation of
+    `fromisoformat` is a lot faster than the generic dateutil parser.
+    ISO dates always start with the year, so anything else is rejected before
+    paying for the exception raised by `fromisoformat`.
+    """
+    if not date[:4].isdigit():
+        return None
+    try:
+        return datetime.datetime.fromisoformat(
+            date[:-1] + '+00:00' if date.endswith('Z') else date)
+    except ValueError:
+        return None
+
+
+def _parse_year_first_date(date: str):
+    """
+    Fast path for dates like YYYY.MM.DD or YYYY/MM/DD, return None for any
+    other format.
+
+    The separator and the length identify the format, so a single strptime
+    call replaces the generic dateutil parser. Invalid dates return None and
+    are left to dateutil.
+    """
+    if len(date) != 10 or date[4] not in './' or date[7] != date[4]:
+        return None
+    try:
+        return datetime.datetime.strptime(
+            date, f'%Y{date[4]}%m{date[4]}%d')
+    except ValueError:
+        return None
+
+
+def _fast_parse(date: str) -> datetime.datetime:
+    """
+    Parse a date string, try the ISO 8601 and year-first fast paths before
+    falling back to the generic dateutil parser, raises the dateutil
+    `ParserError` on failure.
+    """
+    return (_parse_iso_date(date) or _parse_year_first_date(date) or
+            dateutil.parser.parse(date))
 
 
 def check_date_range(date_range: dict) -> bool:
@@ -604,30 +700,38 @@ def check_date_range(date_range: dict) -> bool:
     Check if the user specified date range is a valid range in the past.
 
     Parameter:
-        date_range      [dict]   -   start and end date
+        date_range      [dict]   -   start and end date, either as date
+                                     strings or as `datetime` objects
 
     Return:
                         [bool]
     """
-    now = datetime.datetime.now().astimezone()
+    start = date_range['start']
+    end = date_range['end']
     try:
-        start = dateutil.parser.parse(date_range['start'])
-        end = dateutil.parser.parse(date_range['end'])
+        if not isinstance(start, datetime.datetime):
+            start = _fast_parse(start)
+        if not isinstance(end, datetime.datetime):
+            end = _fast_parse(end)
     except dateutil.parser._parser.ParserError as err:
         logging.error(f"invalid date {date_range['start']} -> "
                       f"{date_range['end']}\n{err}")
         return False
 
-    if start > end:
-        logging.error("Date range check failure: End is before the Start")
-        return False
-
-    if start == end:
-        logging.error("Date range check failure: Start is equal to end")
-        return False
-
-    if start > now or end > now:
-        logging.error("Date range validation: Date range is or ends in the future")
+    # Naive dates are in local time, make them comparable to aware dates
+    if start.tzinfo is None:
+        start = start.astimezone()
+    if end.tzinfo is None:
+        end = end.astimezone()
+    now = datetime.datetime.now().astimezone()
+    if not start < end <= now:
+        if start > end:
+            reason = "End is before the Start"
+        elif start == end:
+            reason = "Start is equal to end"
+        else:
+            reason = "Date range is or ends in the future"
+        logging.error(f"Date range check failure: {reason}")
         return False
 
     return True
@@ -635,57 +739,78 @@ def check_date_range(date_range: dict) -> bool:
 
 def check_order_json(json: dict) -> bool:
     if not json:
-        print(f"ERROR: Empty order JSON object.")
+        logging.error("Empty order JSON object.")
         return False
     missing_keys = [x for x in constants.REQUIRED_ORDER_ATTRIBUTES
-                    if x not in json.keys()]
+                    if x not in json]
     if missing_keys:
-        print("ERROR: Missing JSON attributes for an order: "
-              f"{missing_keys}.")
+        logging.error("Missing JSON attributes for an order: "
+                      f"{missing_keys}.")
         return False
 
     if len(json['orderItems']) < 1:
-        print(f"ERROR: Order must contain at least one item.")
+        logging.error("Order must contain at least one item.")
         return False
 
-
-    for key in json.keys():
-        if key in constants.REQUIRED_ATTRIBUTE_MAPPING.keys() and json[key]:
+    for key in json:
+        if key in constants.REQUIRED_ATTRIBUTE_MAPPING and json[key]:
             missing_keys = [x for x in
                             constants.REQUIRED_ATTRIBUTE_MAPPING[key] if
-                            x not in json[key][0].keys()]
+                            x not in json[key][0]]
             if missing_keys:
-                print(f"ERROR: Missing JSON attributes for the {key} key "
-                      f"within an order: {missing_keys}")
+                logging.error(f"Missing JSON attributes for the {key} key "
+                              f"within an order: {missing_keys}")
                 return False
 
-    if int(json['typeId']) not in range(1,16):
-        print(f"ERROR: Invalid order type ID: {json['typeId']}.")
+    if not 1 <= int(json['typeId']) <= 15:
+        logging.error(f"Invalid order type ID: {json['typeId']}.")
         return False
 
     return True
 
 
+def _split_w3c(date: datetime.datetime) -> tuple:
+    """
+    Format @date as W3C date and UTC offset, the offset is an empty string
+    for dates without timezone information.
+    """
+    offset = date.strftime('%z')
+    if offset:
+        offset = offset[:3] + ':' + offset[3:]
+    return (date.strftime('%Y-%m-%dT%H:%M:%S'), offset)
+
+
+@functools.lru_cache(maxsize=1024)
+def _w3c_parts(date: str) -> tuple:
+    """
+    Parse @date and split it into the W3C date and the UTC offset.
+    Return ('', '') for invalid dates.
+    """
+    try:
+        date = _fast_parse(date)
+    except dateutil.parser._parser.ParserError:
+        return ('', '')
+    return _split_w3c(date)
+
+
 def parse_date(date: str) -> str:
     """
     Transform the given date into a W3C date format as required by the
     PlentyMarkets API.
 
+    Parsed dates are cached, dates without an offset receive the current
+    offset from `get_utc_offset`.
+
     Parameter:
         date            [str]       -   string with the original date.
 
     Return:
                         [str]
     """
-    try:
-        date = dateutil.parser.parse(date)
-    except dateutil.parser._parser.ParserError:
+    date_str, offset = _w3c_parts(date)
+    if not date_str:
         return ''
-    date_str = date.strftime('%Y-%m-%dT%H:%M:%S')
-    offset = date.strftime('%z')
-    if not offset:
-        return date_str + '+' + get_utc_offset()
-    return date_str + offset[:3] + ':' + offset[3:]
+    return date_str + (offset or get_utc_offset())
 
 
 def build_date_range(start: str, end: str) -> dict:
@@ -706,10 +831,14 @@ def build_date_range(start: str, end: str) -> dict:
     return {'start': w3c_start, 'end': w3c_end}
 
 
+@functools.lru_cache(maxsize=1024)
 def date_to_timestamp(date: str) -> int:
     """
     Parse a date object in to a unix timestamp.
 
+    Results are cached, as the conversion only depends on the input string
+    and the local timezone.
+
     Parameter:
         date            [str]       -   date as function parameter in on of the
                                         following formats:
@@ -720,16 +849,20 @@ def date_to_timestamp(date: str) -> int:
     Return:
                         [int]       -   Unix timestamp since 1970-01-01
     """
-    # Check if the date starts with anything else but the year
-    first_number = re.search(r'^\d{2,}(?=\D)', date)
-    if first_number is not None:
-        if int(first_number.group(0)) < 2000:
+    date_obj = _parse_iso_date(date) or _parse_year_first_date(date)
+    if date_obj is None:
+        # Check if the date starts with anything else but the year
+        first_number = _LEADING_NUMBER_RE.match(date)
+        if first_number is not None:
+            if int(first_number.group(0)) < 2000:
+                return -1
+        try:
+            date_obj = dateutil.parser.parse(date)
+        except dateutil.parser._parser.ParserError:
             return -1
-    try:
-        date_obj = dateutil.parser.parse(date)
-    except dateutil.parser._parser.ParserError:
+    elif date_obj.year < 2000:
         return -1
-    return int(time.mktime(date_obj.timetuple()))
+    return int(date_obj.timestamp())
 
 
 def get_temp_creds() -> dict:
@@ -745,63 +878,72 @@ def get_temp_creds() -> dict:
     return {'username': username, 'password': password}
 
 
-def new_keyring_creds(keyring: object) -> dict:
+def new_keyring_creds(keyring: object = None) -> dict:
     """
     Get the credentials for the API from the user and store them into a
     system-wide keyring.
 
     Parameter:
-        keyring         [CredentialManager object]
+        keyring         [CredentialManager object]  -   optional credential
+                                                        manager, defaults to
+                                                        the plenty_api.keyring
+                                                        module functions
     Return:
                         [dict]      - containing username and password
     """
+    keyring = keyring or plenty_api.keyring
     keyring.set_credentials()
     return keyring.get_credentials()
 
 
-def update_keyring_creds(keyring: object) -> dict:
+def update_keyring_creds(keyring: object = None) -> dict:
     """
     Delete the current content of the keyring and get new credentials for the
     API from the user, store them into the keyring.
 
     Parameter:
-        keyring         [CredentialManager object]
+        keyring         [CredentialManager object]  -   optional credential
+                                                        manager, defaults to
+                                                        the plenty_api.keyring
+                                                        module functions
     Return:
                         [dict]      -   containing username and password
     """
+    keyring = keyring or plenty_api.keyring
     keyring.delete_credentials()
     return new_keyring_creds(keyring=keyring)
 
 
 def build_login_token(response_json: dict) -> str:
     """ Fetch the bearer token from the API response object """
-    token_type = response_json['token_type']
-    access_token = response_json['access_token']
-    return token_type + ' ' + access_token
+    return f"{response_json['token_type']} {response_json['access_token']}"
 
 
 def list_contains(search_list: list, target_list: list) -> bool:
     """ Check if all elements of @search_list are found in @target_list """
-    return all(elem in target_list for elem in search_list)
+    try:
+        return set(search_list).issubset(target_list)
+    except TypeError:
+        # Unhashable elements (e.g. lists or dicts) cannot be put into a set
+        return all(elem in target_list for elem in search_list)
+
+
+_JSON_FIELD_CHECKS = {
+    # bool is a subclass of int, but never a valid integer field
+    constants.JSON_INTEGER: lambda field: (isinstance(field, int) and
+                                           not isinstance(field, bool)),
+    constants.JSON_FLOAT: lambda field: isinstance(field, float),
+    constants.JSON_STRING: lambda field: isinstance(field, str),
+    constants.JSON_DICT: lambda field: isinstance(field, dict) and bool(field),
+    constants.JSON_LIST_OF_DICTS: lambda field: (
+        isinstance(field, list) and bool(field) and
+        all(isinstance(x, dict) and x for x in field))
+}
 
 
 def json_field_filled(json_field, field_type: int) -> bool:
     """ Check if the field contains at least one valid element """
-    if field_type == constants.JSON_INTEGER:
-        if not isinstance(json_field, int):
-            return False
-    elif field_type == constants.JSON_FLOAT:
-        if not isinstance(json_field, float):
-            return False
-    elif field_type == constants.JSON_STRING:
-        if not isinstance(json_field, str):
-            return False
-    elif field_type == constants.JSON_DICT:
-        if not isinstance(json_field, dict) or len(json_field) < 1:
-            return False
-    elif field_type == constants.JSON_LIST_OF_DICTS:
-        if not isinstance(json_field, list) or len(json_field) < 1:
-            return False
-        if not all([isinstance(x, dict) and len(x) > 0 for x in json_field]):
-            return False
-    return True
+    check = _JSON_FIELD_CHECKS.get(field_type)
+    if check is None:
+        return True
+    return check(json_field)
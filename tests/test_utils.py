@@ -1,4 +1,7 @@
 import copy
+import datetime
+import re
+import pandas
 import pytest
 import requests
 
@@ -7,68 +10,15 @@ from plenty_api.utils import (
     get_utc_offset, build_query_date, create_vat_mapping, date_to_timestamp,
     get_language, shrink_price_configuration, sanity_check_parameter,
     attribute_variation_mapping, list_contains, json_field_filled,
-    build_transactions, validate_redistribution_template
+    build_transactions, validate_redistribution_template, json_to_dataframe,
+    build_redistribution_json
 )
 
-
-# ======== SAMPLE INPUT DATA ==========
-
-
-@pytest.fixture
-def sample_date_ranges() -> list:
-    samples = [
-        {'start': '2020-09-14T08:00:00+02:00',  # Normal date => CORRECT
-         'end': '2020-09-15T08:00:00+02:00'},
-        {'start': '2020-09-16T08:00:00+02:00',  # End before start => FAIL
-         'end': '2020-09-13T08:00:00+02:00'},
-        {'start': '2019-09-16T08:00:00+02:00',  # Past date => CORRECT
-         'end': '2019-10-13T08:00:00+02:00'},
-        {'start': '2021-09-16T08:00:00+02:00',  # Future date => FAIL
-         'end': '2021-10-13T08:00:00+02:00'}
-    ]
-    return samples
-
-
-@pytest.fixture
-def sample_input_date() -> list:
-    samples = [
-        '2020-09-14',
-        '14-09-2020',
-        '2020-09-14T08:00Z',
-        '2020-09-14T08:00',
-        '2020-09-14T08:00:00+02:00',
-        'abc',
-        ''
-    ]
-    return samples
-
-
-@pytest.fixture
-def expected_date() -> list:
-    expected = [
-        str(f'2020-09-14T00:00:00+{get_utc_offset()}'),
-        str(f'2020-09-14T00:00:00+{get_utc_offset()}'),
-        '2020-09-14T08:00:00+00:00',
-        str(f'2020-09-14T08:00:00+{get_utc_offset()}'),
-        '2020-09-14T08:00:00+02:00',
-        '',
-        ''
-    ]
-    return expected
+# Local offset attached to dates without timezone information
+UTC_OFFSET = get_utc_offset()
 
 
-@pytest.fixture
-def sample_date_range_input() -> list:
-    samples = [
-        {'start': '2020-09-14', 'end': '2020-09-15'},
-        {'start': '2020-09-14', 'end': '2020-09-13'},
-        {'start': '2020-09-14T08:00Z', 'end': '2020-09-14T09:00Z'},
-        {'start': '2020-09-14T08:00:00+02:00',
-         'end': '2020-09-14T10:00:30+02:00'},
-        {'start': 'abc', 'end': 'def'},
-        {'start': '', 'end': ''}
-    ]
-    return samples
+# ======== SAMPLE INPUT DATA ==========
 
 
 @pytest.fixture
@@ -127,50 +77,6 @@ def sample_price_response() -> list:
     return samples
 
 
-@pytest.fixture
-def expected_date_range() -> list:
-    expected = [
-        {'start': str(f'2020-09-14T00:00:00+{get_utc_offset()}'),
-         'end': str(f'2020-09-15T00:00:00+{get_utc_offset()}')},
-        {'start': str(f'2020-09-14T00:00:00+{get_utc_offset()}'),
-         'end': str(f'2020-09-13T00:00:00+{get_utc_offset()}')},
-        {'start': '2020-09-14T08:00:00+00:00',
-         'end': '2020-09-14T09:00:00+00:00'},
-        {'start': '2020-09-14T08:00:00+02:00',
-         'end': '2020-09-14T10:00:30+02:00'},
-        None,
-        None
-    ]
-    return expected
-
-
-@pytest.fixture
-def sample_query_data() -> list:
-    samples = [
-        {'date_range': {'start': '2020-09-14T08:00:00+02:00',
-                        'end': '2020-09-14T10:00:30+02:00'},
-         'date_type': 'Creation'},
-        {'date_range': {'start': '2020-09-14T08:00:00+02:00',
-                        'end': '2020-09-14T10:00:30+02:00'},
-         'date_type': 'Payment'},
-        {'date_range': {'start': '2020-09-14T08:00:00+02:00',
-                        'end': '2020-09-14T10:00:30+02:00'},
-         'date_type': 'Change'},
-        {'date_range': {'start': '2020-09-14T08:00:00+02:00',
-                        'end': '2020-09-14T10:00:30+02:00'},
-         'date_type': 'Delivery'},
-        {'date_range': {},
-         'date_type': 'Creation'},
-        {'date_range': {'start': '2020-09-14T08:00:00+02:00',
-                        'end': '2020-09-14T10:00:30+02:00'},
-         'date_type': ''},
-        {'date_range': {'start': '2020-09-14T08:00:00+02:00',
-                        'end': '2020-09-14T10:00:30+02:00'},
-         'date_type': 'Creation'}
-    ]
-    return samples
-
-
 @pytest.fixture
 def sample_vat_data() -> list:
     samples = [
@@ -366,7 +272,6 @@ def sample_variation_data() -> list:
 
 
 @pytest.fixture
-<<<<<<< HEAD
 def sample_orders() -> list:
     orders = [
         # Valid order
@@ -490,6 +395,7 @@ def sample_orders() -> list:
     return orders
 
 
+@pytest.fixture
 def sample_redistribution():
     order = {
         "id": 1,
@@ -594,25 +500,6 @@ def sample_redistribution_with_extra_attributes(
 # ======== EXPECTED DATA ==========
 
 
-@pytest.fixture
-def expected_date_query() -> list:
-    expected = [
-        'createdAtFrom=2020-09-14T08%3A00%3A00%2B02%3A00' +
-        '&createdAtTo=2020-09-14T10%3A00%3A30%2B02%3A00',
-        'paidAtFrom=2020-09-14T08%3A00%3A00%2B02%3A00' +
-        '&paidAtTo=2020-09-14T10%3A00%3A30%2B02%3A00',
-        'updatedAtFrom=2020-09-14T08%3A00%3A00%2B02%3A00' +
-        '&updatedAtTo=2020-09-14T10%3A00%3A30%2B02%3A00',
-        'outgoingItemsBookedAtFrom=2020-09-14T08%3A00%3A00%2B02%3A00' +
-        '&outgoingItemsBookedAtTo=2020-09-14T10%3A00%3A30%2B02%3A00',
-        '',
-        '',
-        'createdAtFrom=2020-09-14T08%3A00%3A00%2B02%3A00' +
-        '&createdAtTo=2020-09-14T10%3A00%3A30%2B02%3A00'
-    ]
-    return expected
-
-
 @pytest.fixture
 def expected_query_attributes() -> list:
     expected = [
@@ -782,12 +669,14 @@ def test_build_endpoint() -> None:
         {'url': '',
          'route': '/rest/orders'},
         {'url': 'https://test.plentymarkets-cloud01.com',
-         'route': ''}
+         'route': ''},
+        {'url': 'https://',
+         'route': '/rest/orders'}
     ]
 
     expected = ['https://test.plentymarkets-cloud01.com/rest/orders',
                 'https://test.plentymarkets-cloud01.com/rest/orders', '', '',
-                '', '']
+                '', '', '']
     result = []
 
     for sample in sample_data:
@@ -797,49 +686,97 @@ def test_build_endpoint() -> None:
     assert expected == result
 
 
-def test_check_date_range(sample_date_ranges: list) -> None:
-    expected = [True, False, True, False]
-    result = []
-
-    for sample in sample_date_ranges:
-        result.append(check_date_range(date_range=sample))
-
-    assert expected == result
-
-
-def test_parse_date(sample_input_date: list,
-                    expected_date: list) -> None:
-    result = []
-
-    for sample in sample_input_date:
-        result.append(parse_date(date=sample))
-
-    assert expected_date == result
-
-
-def test_build_date_range(sample_date_range_input: list,
-                          expected_date_range: list) -> None:
-    result = []
-    for sample in sample_date_range_input:
-        result.append(build_date_range(start=sample['start'],
-                                       end=sample['end']))
-
-    assert expected_date_range == result
-
-
-def test_F_date(sample_query_data: list,
-                expected_date_query: list) -> None:
-    result = []
-
-    for sample in sample_query_data:
-        query = build_query_date(date_range=sample['date_range'],
-                                 date_type=sample['date_type'])
-        req = requests.Request('POST', 'https://httpbin.org/get', params=query)
-        prepped = req.prepare()
-        result += (prepped.url.split('?')[1:])
-        if not prepped.url.split('?')[1:]:
-            result.append('')
-    assert expected_date_query == result
+def test_get_utc_offset() -> None:
+    offset = get_utc_offset()
+
+    assert re.fullmatch(r'[+-]\d{2}:\d{2}', offset)
+    assert offset.replace(':', '') == \
+        datetime.datetime.now().astimezone().strftime('%z')
+    assert offset == get_utc_offset()
+
+
+@pytest.mark.parametrize('date_range, expected', [
+    ({'start': '2020-09-14T08:00:00+02:00',  # Normal date
+      'end': '2020-09-15T08:00:00+02:00'}, True),
+    ({'start': '2020-09-16T08:00:00+02:00',  # End before start
+      'end': '2020-09-13T08:00:00+02:00'}, False),
+    ({'start': '2019-09-16T08:00:00+02:00',  # Past date
+      'end': '2019-10-13T08:00:00+02:00'}, True),
+    ({'start': '2099-09-16T08:00:00+02:00',  # Future date
+      'end': '2099-10-13T08:00:00+02:00'}, False),
+    ({'start': '2020-09-14T08:00:00+02:00',  # Equal dates
+      'end': '2020-09-14T08:00:00+02:00'}, False),
+    ({'start': datetime.datetime(2020, 9, 14, 8,  # datetime objects
+                                 tzinfo=datetime.timezone.utc),
+      'end': datetime.datetime(2020, 9, 15, 8,
+                               tzinfo=datetime.timezone.utc)}, True),
+    ({'start': '2020-09-14',  # Naive start & aware end
+      'end': '2020-09-15T08:00:00+02:00'}, True)
+])
+def test_check_date_range(date_range: dict, expected: bool) -> None:
+    assert expected == check_date_range(date_range=date_range)
+
+
+@pytest.mark.parametrize('date, expected', [
+    ('2020-09-14', f'2020-09-14T00:00:00{UTC_OFFSET}'),
+    ('14-09-2020', f'2020-09-14T00:00:00{UTC_OFFSET}'),
+    ('2020/09/14', f'2020-09-14T00:00:00{UTC_OFFSET}'),
+    ('2020-09-14T08:00Z', '2020-09-14T08:00:00+00:00'),
+    ('2020-09-14T08:00', f'2020-09-14T08:00:00{UTC_OFFSET}'),
+    ('2020-09-14T08:00:00+02:00', '2020-09-14T08:00:00+02:00'),
+    ('abc', ''),
+    ('', '')
+])
+def test_parse_date(date: str, expected: str) -> None:
+    assert expected == parse_date(date=date)
+
+
+@pytest.mark.parametrize('start, end, expected', [
+    ('2020-09-14', '2020-09-15',
+     {'start': f'2020-09-14T00:00:00{UTC_OFFSET}',
+      'end': f'2020-09-15T00:00:00{UTC_OFFSET}'}),
+    ('2020-09-14', '2020-09-13',
+     {'start': f'2020-09-14T00:00:00{UTC_OFFSET}',
+      'end': f'2020-09-13T00:00:00{UTC_OFFSET}'}),
+    ('2020-09-14T08:00Z', '2020-09-14T09:00Z',
+     {'start': '2020-09-14T08:00:00+00:00',
+      'end': '2020-09-14T09:00:00+00:00'}),
+    ('2020-09-14T08:00:00+02:00', '2020-09-14T10:00:30+02:00',
+     {'start': '2020-09-14T08:00:00+02:00',
+      'end': '2020-09-14T10:00:30+02:00'}),
+    ('abc', 'def', None),
+    ('', '', None)
+])
+def test_build_date_range(start: str, end: str, expected: dict) -> None:
+    assert expected == build_date_range(start=start, end=end)
+
+
+@pytest.mark.parametrize('date_range, date_type, expected', [
+    ({'start': '2020-09-14T08:00:00+02:00',
+      'end': '2020-09-14T10:00:30+02:00'}, 'Creation',
+     'createdAtFrom=2020-09-14T08%3A00%3A00%2B02%3A00' +
+     '&createdAtTo=2020-09-14T10%3A00%3A30%2B02%3A00'),
+    ({'start': '2020-09-14T08:00:00+02:00',
+      'end': '2020-09-14T10:00:30+02:00'}, 'Payment',
+     'paidAtFrom=2020-09-14T08%3A00%3A00%2B02%3A00' +
+     '&paidAtTo=2020-09-14T10%3A00%3A30%2B02%3A00'),
+    ({'start': '2020-09-14T08:00:00+02:00',
+      'end': '2020-09-14T10:00:30+02:00'}, 'Change',
+     'updatedAtFrom=2020-09-14T08%3A00%3A00%2B02%3A00' +
+     '&updatedAtTo=2020-09-14T10%3A00%3A30%2B02%3A00'),
+    ({'start': '2020-09-14T08:00:00+02:00',
+      'end': '2020-09-14T10:00:30+02:00'}, 'Delivery',
+     'outgoingItemsBookedAtFrom=2020-09-14T08%3A00%3A00%2B02%3A00' +
+     '&outgoingItemsBookedAtTo=2020-09-14T10%3A00%3A30%2B02%3A00'),
+    ({}, 'Creation', ''),
+    ({'start': '2020-09-14T08:00:00+02:00',
+      'end': '2020-09-14T10:00:30+02:00'}, '', '')
+])
+def test_F_date(date_range: dict, date_type: str, expected: str) -> None:
+    query = build_query_date(date_range=date_range, date_type=date_type)
+    prepped = requests.PreparedRequest()
+    prepped.prepare_url('https://httpbin.org/get', params=query)
+    assert [expected] == (prepped.url.split('?')[1:] or [''])
 
 
 def test_create_vat_mapping(sample_vat_data: list) -> None:
@@ -869,8 +806,10 @@ def test_create_vat_mapping(sample_vat_data: list) -> None:
 def test_date_to_timestamp() -> None:
     samples = ['2020-08-01', '2020-08-01T15:00', '2020-08-01T15:00:00+02:00',
                '01-08-2020', '2020.08.01', 'abc', '']
-    expected = [1596232800, 1596286800, 1596290400,
-                -1, 1596232800, -1, -1]
+    # Naive dates are interpreted in the local timezone
+    midnight = int(datetime.datetime(2020, 8, 1).timestamp())
+    afternoon = int(datetime.datetime(2020, 8, 1, 15, 0).timestamp())
+    expected = [midnight, afternoon, 1596286800, -1, midnight, -1, -1]
     result = []
 
     for sample in samples:
@@ -936,6 +875,15 @@ def test_attribute_variation_mapping(sample_attributes: list,
     assert expected_attribute_variation_map == result
 
 
+def test_attribute_variation_mapping_attribute_without_values():
+    variation = [{'id': 1, 'variationAttributeValues': [
+        {'attributeId': 5, 'valueId': 1}]}]
+    attribute = [{'id': 1}]
+
+    assert [{'id': 1}] == attribute_variation_mapping(variation=variation,
+                                                      attribute=attribute)
+
+
 def test_list_contains():
     l1 = [
         [1, 2, 3],
@@ -943,7 +891,9 @@ def test_list_contains():
         ['aba', 'bcb', 'cdc'],
         ['a', 'b', 'c'],
         ['aba', 'bcb'],
-        []
+        [],
+        [[1]],
+        [{'a': 1}]
     ]
     l2 = [
         [1, 4, 5, 6, 2, 3],
@@ -951,10 +901,12 @@ def test_list_contains():
         ['aba', 'bcb', 'cdc'],
         ['a', 'c', 'd'],
         [],
-        [1, 2, 3]
+        [1, 2, 3],
+        [[1], [2]],
+        [{'a': 2}]
     ]
     result = []
-    expected = [True, True, True, False, False, True]
+    expected = [True, True, True, False, False, True, True, False]
 
     for lists in zip(l1, l2):
         result.append(list_contains(search_list=lists[0],
@@ -966,9 +918,11 @@ def test_list_contains():
 def test_json_field_filled():
     sample = [
         (1, 0), (1.0, 1), ('test', 2), ({'test': 1}, 3),
-        ([{'test': 1}], 4), ('test', 0), (1, 2), ({}, 3), ([{}], 4)
+        ([{'test': 1}], 4), ('test', 0), (1, 2), ({}, 3), ([{}], 4),
+        (True, 0)
     ]
-    expected = [True, True, True, True, True, False, False, False, False]
+    expected = [True, True, True, True, True, False, False, False, False,
+                False]
     result = []
 
     for json_field, field_type in sample:
@@ -978,6 +932,23 @@ def test_json_field_filled():
     assert expected == result
 
 
+def test_json_to_dataframe():
+    samples = [
+        [{'id': 1, 'name': 'a', 'tags': [1, 2]}, {'id': 2, 'number': 3}],
+        [{'id': 1, 'item': {'id': 5, 'name': 'a'}}, {'id': 2}],
+        {'id': 1, 'item': {'id': 5}}
+    ]
+
+    for sample in samples:
+        expected = pandas.json_normalize(sample)
+        assert expected.equals(json_to_dataframe(json=sample))
+
+    for sample in samples:
+        result = json_to_dataframe(json=sample, columns=['id', 'missing'])
+        assert ['id', 'missing'] == list(result.columns)
+        assert result['missing'].isna().all()
+
+
 def describe_build_transactions():
     def with_no_outgoing_or_incoming_transaction(
             sample_redistribution: dict,
@@ -1127,3 +1098,36 @@ def describe_validate_redistribution_template():
         sample[1]['locations'][1]['targets'][0]['quantity'] = 8
         template = {'variations': sample}
         assert False is validate_redistribution_template(template)
+
+
+def describe_build_redistribution_json():
+    def with_default_values(
+            sample_redistribution_without_transactions: list):
+        template = {'plenty_id': 1234, 'sender': 1, 'receiver': 2,
+                    'variations': sample_redistribution_without_transactions}
+        result = build_redistribution_json(template=template)
+
+        assert 15 == result['typeId']
+        assert [1234, 2345] == [
+            item['itemVariationId'] for item in result['orderItems']]
+        assert [10, 12] == [item['quantity'] for item in result['orderItems']]
+        for item in result['orderItems']:
+            assert [{'isSystemCurrency': True, 'priceOriginalGross': 0}] == \
+                item['amounts']
+            assert 'referrerId' not in item
+        assert [1, 2] == [
+            relation['referenceId'] for relation in result['relations']]
+
+    def with_amounts_and_referrer(
+            sample_redistribution_without_transactions: list):
+        sample = sample_redistribution_without_transactions
+        sample[0]['amounts'] = 5.5
+        sample[0]['referrer'] = 1.0
+        template = {'plenty_id': 1234, 'sender': 1, 'receiver': 2,
+                    'variations': sample}
+        result = build_redistribution_json(template=template)
+
+        assert [{'isSystemCurrency': True, 'priceOriginalGross': 5.5}] == \
+            result['orderItems'][0]['amounts']
+        assert 1.0 == result['orderItems'][0]['referrerId']
+        assert 'referrerId' not in result['orderItems'][1]